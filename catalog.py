@@ -0,0 +1,103 @@
+"""COM4018 – Shared equipment catalogue, line pricing and hire-line record
+
+Read-only price list (Figure 2), the pricing rule, the priced item-line record
+and the small input helper used by the hire console scripts, kept in one place
+so each script imports them instead of carrying its own copy.
+
+Pricing rules:
+- First night: 100% of the listed daily rate (per item).
+- Each additional night: +50% of the daily rate (per item, per night).
+- Late return (after 2pm): one extra additional night (+50%) per item.
+- Money is handled as integer pence to avoid floating-point error.
+"""
+
+# -----------------------------
+# Read-only equipment catalogue (Figure 2)
+# -----------------------------
+ADDITIONAL_NIGHT_MULTIPLIER_NUM = 1  # for 50% we add daily_p // 2 per additional night
+ADDITIONAL_NIGHT_MULTIPLIER_DEN = 2
+
+
+def _entry(code: str, name: str, daily_p: int) -> dict:
+    """Return one catalogue entry with its per-unit additional-night rate folded in."""
+    return {
+        "code": code,
+        "name": name,
+        "daily_p": daily_p,
+        "add_per_unit_p": daily_p * ADDITIONAL_NIGHT_MULTIPLIER_NUM // ADDITIONAL_NIGHT_MULTIPLIER_DEN,
+    }
+
+
+# Every daily_p must stay even (whole pounds here): calc_line_costs scales the
+# halved per-unit rate by qty, which only matches halving daily_p * qty when
+# daily_p is even. Keep that in mind when adding an item.
+CATALOG = (
+    _entry("DCH", "Day chairs", 1500),               # £15.00
+    _entry("BCH", "Bed chairs", 2500),               # £25.00
+    _entry("BAS", "Bite Alarm (set of 3)", 2000),    # £20.00
+    _entry("BA1", "Bite Alarm (single)", 500),       # £5.00
+    _entry("BBT", "Bait Boat", 6000),                # £60.00
+    _entry("TNT", "Camping tent", 2000),             # £20.00
+    _entry("SLP", "Sleeping bag", 2000),             # £20.00
+    _entry("R3T", "Rods (3lb TC)", 1000),            # £10.00
+    _entry("RBR", "Rods (Bait runners)", 500),       # £5.00
+    _entry("REB", "Reels (Bait runners)", 1000),     # £10.00
+    _entry("STV", "Camping Gas stove (Double burner)", 1000),  # £10.00
+)
+
+# code → catalogue entry, built once for O(1) lookups
+CATALOG_BY_CODE = {it["code"]: it for it in CATALOG}
+
+# Known-codes summary used in prompts and error messages
+CATALOG_CODES_STR = ", ".join(it["code"] for it in CATALOG)
+
+
+# -----------------------------
+# Lookups and pricing
+# -----------------------------
+def find_item(code: str) -> dict | None:
+    """Return catalog item dict by item code (case-insensitive), else None."""
+    return CATALOG_BY_CODE.get(str(code).upper())
+
+
+def catalog_codes() -> str:
+    """Return a compact string of known codes for prompts."""
+    return CATALOG_CODES_STR
+
+
+def calc_line_costs(item: dict, qty: int, nights: int,
+                    returned_on_time: bool) -> tuple[int, int, int]:
+    """Return (first_night_p, additional_p, extra_delay_p) for one line."""
+    first_night_p = item["daily_p"] * qty
+    if nights <= 1 and returned_on_time:
+        # Common single on-time night: no additional or delay charge to compute
+        return first_night_p, 0, 0
+    add_per_night = item["add_per_unit_p"] * qty
+    additional_p = add_per_night * (nights - 1 if nights > 1 else 0)
+    extra_delay_p = 0 if returned_on_time else add_per_night
+    return first_night_p, additional_p, extra_delay_p
+
+
+# -----------------------------
+# Priced item-line record and input helpers
+# -----------------------------
+class HireLine:
+    """One priced item line of a hire; all amounts are integer pence."""
+    __slots__ = ("code", "name", "qty", "daily_p", "first_night_p",
+                 "additional_nights_p", "extra_delay_p", "line_total_p")
+
+    def __init__(self, code: str, name: str, qty: int, daily_p: int,
+                 first_night_p: int, additional_nights_p: int, extra_delay_p: int) -> None:
+        self.code = code
+        self.name = name
+        self.qty = qty
+        self.daily_p = daily_p
+        self.first_night_p = first_night_p
+        self.additional_nights_p = additional_nights_p
+        self.extra_delay_p = extra_delay_p
+        self.line_total_p = first_night_p + additional_nights_p + extra_delay_p
+
+
+def digits_only(text: str) -> str:
+    """Return only the digit characters of text."""
+    return "".join(filter(str.isdigit, text))
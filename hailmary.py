@@ -15,7 +15,8 @@ Design notes:
 CUSTOMER_ENTRY_INSTRUCTIONS = (
     "\nEnter customer (comma separated):\n"
     "  name, phone, house_no, postcode, card_last4\n"
-    "  Example:  Jane Smith, 07900111222, 12, LE1 2AB, 1234"
+    "  Example:  Jane Smith, 07900111222, 12, LE1 2AB, 1234\n"
+    "Type 'cancel' to return to the menu without saving."
 )
 
 ITEM_LINES_INSTRUCTIONS = (
@@ -29,25 +30,45 @@ MAIN_MENU_LINES = (
     "2) Create report",
     "3) Exit",
 )
+_MAIN_MENU_TEXT = "\n".join(MAIN_MENU_LINES)
 
 PROMPT_SELECT_OPTION = "Select an option (1-3): "
 
+# Accepted answers for the menu and yes/no prompts
+_VALID_CHOICES = frozenset({1, 2, 3})
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
 # ---------- Read-only equipment catalogue (Figure 2)
 
+class Item:
+    """A catalogue entry (code, name, nightly pence) stored in fixed slots."""
+    __slots__ = ("code", "name", "daily_p")
+
+    def __init__(self, code: str, name: str, daily_p: int) -> None:
+        """Store the item code, display name and nightly price in pence."""
+        self.code = code
+        self.name = name
+        self.daily_p = daily_p
+
 CATALOG = (
-    {"code": "DCH", "name": "Day chairs", "daily_p": 1500},
-    {"code": "BCH", "name": "Bed chairs", "daily_p": 2500},
-    {"code": "BAS", "name": "Bite Alarm (set of 3)", "daily_p": 2000},
-    {"code": "BA1", "name": "Bite Alarm (single)", "daily_p": 500},
-    {"code": "BBT", "name": "Bait Boat", "daily_p": 6000},
-    {"code": "TNT", "name": "Camping tent", "daily_p": 2000},
-    {"code": "SLP", "name": "Sleeping bag", "daily_p": 2000},
-    {"code": "R3T", "name": "Rods (3lb TC)", "daily_p": 1000},
-    {"code": "RBR", "name": "Rods (Bait runners)", "daily_p": 500},
-    {"code": "REB", "name": "Reels (Bait runners)", "daily_p": 1000},
-    {"code": "STV", "name": "Camping Gas stove (Double burner)", "daily_p": 1000},
+    Item("DCH", "Day chairs", 1500),
+    Item("BCH", "Bed chairs", 2500),
+    Item("BAS", "Bite Alarm (set of 3)", 2000),
+    Item("BA1", "Bite Alarm (single)", 500),
+    Item("BBT", "Bait Boat", 6000),
+    Item("TNT", "Camping tent", 2000),
+    Item("SLP", "Sleeping bag", 2000),
+    Item("R3T", "Rods (3lb TC)", 1000),
+    Item("RBR", "Rods (Bait runners)", 500),
+    Item("REB", "Reels (Bait runners)", 1000),
+    Item("STV", "Camping Gas stove (Double burner)", 1000),
 )
 
+# Derived once from the read-only CATALOG: code → entry, and the prompt summary
+_CATALOG_BY_CODE = {it.code: it for it in CATALOG}
+_CATALOG_CODES = ", ".join(_CATALOG_BY_CODE)
+
 # ---------- Pricing rules (per brief) as rationals for clarity
 
 ADDITIONAL_NIGHT_MULTIPLIER_NUM = 1  # 50% per additional night
@@ -55,37 +76,41 @@ ADDITIONAL_NIGHT_MULTIPLIER_DEN = 2
 
 # ---------- State
 
+# Customer IDs run sequentially from here in save order (matches brief samples)
+_FIRST_CUSTOMER_ID = 101
+
 class AppState:
     """Holds mutable programme state for the current run."""
     def __init__(self) -> None:
-        """Initialise the hire ledger and sequential customer IDs."""
+        """Initialise the hire ledger; customer IDs derive from its length."""
         self.hire_records: list[dict] = []
-        self.next_customer_id: int = 101
 
 # ---------- Utilities
 
+_MONEY_CACHE: dict[int, str] = {}
+
 def money(pence: int) -> str:
-    """Return integer pence as a sterling string '£x.xx'."""
-    pounds = pence // 100
-    pennies = pence % 100
-    return f"£{pounds}.{pennies:02d}"
+    """Return integer pence as a sterling string '£x.xx' (memoised per value)."""
+    text = _MONEY_CACHE.get(pence)
+    if text is None:
+        text = _MONEY_CACHE[pence] = "£%d.%02d" % divmod(pence, 100)
+    return text
 
-def find_item(code: str) -> dict | None:
+def find_item(code: str) -> Item | None:
     """Return the catalogue entry for code (case-insensitive) or None."""
-    code = str(code).upper()
-    for it in CATALOG:
-        if it["code"] == code:
-            return it
-    return None
+    return _CATALOG_BY_CODE.get(str(code).upper())
+
+def _digits_only(text: str) -> str:
+    """Return only the digit characters of text."""
+    return "".join(filter(str.isdigit, text))
 
 def catalog_codes() -> str:
     """Return a comma-separated catalogue code summary for prompts."""
-    return ", ".join(it["code"] for it in CATALOG)
+    return _CATALOG_CODES
 
 def print_main_menu() -> None:
     """Display the main menu exactly as specified in the brief."""
-    for line in MAIN_MENU_LINES:
-        print(line)
+    print(_MAIN_MENU_TEXT)
 
 def _wrap_equipment(text: str, width: int) -> list[str]:
     """Word-wrap the equipment description to a fixed width.
@@ -143,15 +168,15 @@ def read_choice() -> int | None:
         n = int(s)
     except ValueError:
         return None
-    return n if n in (1, 2, 3) else None
+    return n if n in _VALID_CHOICES else None
 
 def read_yes_no(prompt: str = "(y/n): ") -> bool:
     """Prompt until the user enters yes/no; return True for yes, False for no."""
     while True:
         s = input(prompt).strip().lower()
-        if s in ("y", "yes"):
+        if s in _YES:
             return True
-        if s in ("n", "no"):
+        if s in _NO:
             return False
         print("Please enter 'y' or 'n'.")
 
@@ -183,19 +208,20 @@ def _parse_customer_header(raw: str) -> dict:
     Returns:
         A dictionary containing the normalised customer details.
     """
-    parts = [p.strip() for p in raw.split(",")]
-    if len(parts) != 5:
+    parts = raw.split(",", 4)
+    if len(parts) != 5 or "," in parts[4]:
         raise ValueError("Expected 5 fields separated by commas.")
 
     name, phone, house_no, postcode, card_last4 = parts
+    name = name.strip()
     if not name:
         raise ValueError("Name cannot be empty.")
 
-    phone_digits = "".join(ch for ch in phone if ch.isdigit())
+    phone_digits = _digits_only(phone)
     if len(phone_digits) < 7:
         raise ValueError("Phone should contain at least 7 digits.")
 
-    card_digits = "".join(ch for ch in card_last4 if ch.isdigit())
+    card_digits = _digits_only(card_last4)
     if len(card_digits) != 4:
         raise ValueError("Card last 4 digits must be exactly 4 digits.")
 
@@ -207,14 +233,13 @@ def _parse_customer_header(raw: str) -> dict:
         "card_last4": card_digits,
     }
 
-def _parse_item_line(raw: str) -> tuple[str, int]:
-    """Return (code, qty) parsed from raw, or raise ValueError."""
-    parts = [p.strip() for p in raw.split(",")]
-    if len(parts) != 2:
+def _parse_item_line(raw: str) -> tuple[Item, int]:
+    """Return (catalogue item, qty) parsed from raw, or raise ValueError."""
+    code_s, sep, qty_s = raw.partition(",")
+    if not sep or "," in qty_s:
         raise ValueError("Expected 2 fields: CODE, quantity")
 
-    code_s, qty_s = parts
-    code = code_s.upper()
+    code = code_s.strip().upper()
     item = find_item(code)
     if not item:
         raise ValueError(f"Unknown code '{code}'. Known: {catalog_codes()}")
@@ -227,14 +252,13 @@ def _parse_item_line(raw: str) -> tuple[str, int]:
     if qty < 1:
         raise ValueError("Quantity must be ≥ 1.")
 
-    return code, qty
+    return item, qty
 
 # ---------- Interactive readers (loop + messages; use pure parsers)
 
 def read_customer_header() -> dict | None:
     """Prompt repeatedly for customer fields or return None if cancelled."""
     print(CUSTOMER_ENTRY_INSTRUCTIONS)
-    print("Type 'cancel' to return to the menu without saving.")
     while True:
         raw = input("> ").strip()
         if raw.lower() in {"", "cancel"}:
@@ -248,17 +272,23 @@ def read_customer_header() -> dict | None:
 def calc_line_costs(daily_p: int, qty: int, nights: int, returned_on_time: bool) -> tuple[int, int, int]:
     """Return (first_night, additional, delay) in pence."""
     first_night_p = daily_p * qty
-    add_per_night = (daily_p * qty * ADDITIONAL_NIGHT_MULTIPLIER_NUM) // ADDITIONAL_NIGHT_MULTIPLIER_DEN
+    add_per_night = (first_night_p * ADDITIONAL_NIGHT_MULTIPLIER_NUM) // ADDITIONAL_NIGHT_MULTIPLIER_DEN
     additional_p = add_per_night * max(0, nights - 1)
     extra_delay_p = 0 if returned_on_time else add_per_night
     return first_night_p, additional_p, extra_delay_p
 
-def read_item_lines(nights: int, returned_on_time: bool) -> list[dict]:
-    """Collect item lines, computing totals eagerly for downstream reporting."""
+def read_item_lines(nights: int, returned_on_time: bool) -> tuple[list[dict], str]:
+    """Collect item lines, computing totals eagerly for downstream reporting.
+
+    Returns:
+        The priced line dicts and the 'name – qty, …' equipment summary,
+        built as each line is accepted.
+    """
     print(ITEM_LINES_INSTRUCTIONS)
     print(f"Nights for this hire: {nights}  | Returned on time: {returned_on_time}")
     print(f"Known codes: {catalog_codes()}")
     lines: list[dict] = []
+    summary_parts: list[str] = []
 
     while True:
         raw = input("> ").strip()
@@ -266,20 +296,19 @@ def read_item_lines(nights: int, returned_on_time: bool) -> list[dict]:
             if not lines:
                 print("You must enter at least one item.")
                 continue
-            return lines
+            return lines, ", ".join(summary_parts)
 
         try:
-            code, qty = _parse_item_line(raw)
+            item, qty = _parse_item_line(raw)
         except ValueError as err:
             print(err)
             continue
 
-        item = find_item(code)  # safe after _parse_item_line
-        daily = item["daily_p"]
+        daily = item.daily_p
         first_p, add_p, delay_p = calc_line_costs(daily, qty, nights, returned_on_time)
         lines.append({
-            "code": code,
-            "name": item["name"],
+            "code": item.code,
+            "name": item.name,
             "qty": qty,
             "daily_p": daily,
             "first_night_p": first_p,
@@ -287,6 +316,7 @@ def read_item_lines(nights: int, returned_on_time: bool) -> list[dict]:
             "extra_delay_p": delay_p,
             "line_total_p": first_p + add_p + delay_p,
         })
+        summary_parts.append(f"{item.name} – {qty}")
 
 # ---------- Flows
 
@@ -300,14 +330,13 @@ def run_hire_flow(state: AppState) -> None:
 
         nights = read_positive_int("Number of nights: ", min_value=1)
         returned_on_time = read_yes_no("Returned on time (y/n)? ")
-        lines = read_item_lines(nights, returned_on_time)
+        lines, items_summary = read_item_lines(nights, returned_on_time)
 
-        items_summary = ", ".join(f"{ln['name']} – {ln['qty']}" for ln in lines)
         extra_delay_p = sum(ln["extra_delay_p"] for ln in lines)
         total_p = sum(ln["line_total_p"] for ln in lines)
 
         hire = {
-            "customer_id": state.next_customer_id,
+            "customer_id": _FIRST_CUSTOMER_ID + len(state.hire_records),
             "customer_name": header["customer_name"],
             "nights": nights,
             "returned_on_time": returned_on_time,  # bool internally
@@ -317,7 +346,6 @@ def run_hire_flow(state: AppState) -> None:
             "items_summary": items_summary,
         }
         state.hire_records.append(hire)
-        state.next_customer_id += 1
 
         print("\nSaved hire:")
         print(f"  Customer ID: {hire['customer_id']}")
@@ -360,9 +388,14 @@ def run_earnings_report(state: AppState) -> None:
     ONTIME_W = 24
     EXTRA_W = 32
 
+    # Row layout built once from the widths above; every row reuses it.
+    row_fmt = f"{{:<{ID_W}}} | {{}} | {{:<{NIGHTS_W}}} | {{:<{TOTAL_W}}} | {{:<{ONTIME_W}}} | {{:<{EXTRA_W}}}"
+
     # Headers in the “Original from B” plain table style (kept verbatim)
-    print("Customer ID | Equipment                                                       | Number of nights | Total Cost | Returned on time (y/n) | Extra charge for delayed return")
-    print("------------+-----------------------------------------------------------------+------------------+------------+------------------------+--------------------------------")
+    out = [
+        "Customer ID | Equipment                                                       | Number of nights | Total Cost | Returned on time (y/n) | Extra charge for delayed return",
+        "------------+-----------------------------------------------------------------+------------------+------------+------------------------+--------------------------------",
+    ]
 
     for hire in state.hire_records:
         cust_id = hire["customer_id"]
@@ -371,30 +404,18 @@ def run_earnings_report(state: AppState) -> None:
         extra_pounds = hire["extra_delay_p"] // 100
         on_time_char = "y" if hire["returned_on_time"] else "n"
 
-        # Wrap the equipment string to EQUIP_W and print across multiple physical rows.
+        # Wrap the equipment string to EQUIP_W and emit across multiple physical rows.
         equip_lines = _wrap_equipment(hire["items_summary"], EQUIP_W)
 
         # First (main) row carries all numeric/flag columns.
-        first = equip_lines[0]
-        print(
-            f"{cust_id:<{ID_W}} | "
-            f"{first} | "
-            f"{nights:<{NIGHTS_W}} | "
-            f"{total_pounds:<{TOTAL_W}} | "
-            f"{on_time_char:<{ONTIME_W}} | "
-            f"{extra_pounds:<{EXTRA_W}}"
-        )
+        out.append(row_fmt.format(cust_id, equip_lines[0], nights, total_pounds, on_time_char, extra_pounds))
 
         # Continuation rows: only the Equipment column is populated; others blank.
         for cont in equip_lines[1:]:
-            print(
-                f"{'':<{ID_W}} | "
-                f"{cont} | "
-                f"{'':<{NIGHTS_W}} | "
-                f"{'':<{TOTAL_W}} | "
-                f"{'':<{ONTIME_W}} | "
-                f"{'':<{EXTRA_W}}"
-            )
+            out.append(row_fmt.format("", cont, "", "", "", ""))
+
+    # One write for the whole table rather than a print per row.
+    print("\n".join(out))
 
 
 # ---------- Entry point
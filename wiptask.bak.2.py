@@ -7,9 +7,12 @@ Design notes:
 - Monetary values are stored as integer pence to avoid floating-point rounding issues.
 - Pricing rules: first night at 100%; each additional night at 50%; late returns incur one extra 50% night.
 - Parsing is split into pure functions (which raise ValueError) and interactive readers (which loop with messages).
-- No imports used.
+- Catalogue, line pricing and the HireLine record come from the shared catalog module; no other imports.
 """
 
+# Catalogue, line pricing and the hire-line record are shared between the hire scripts
+from catalog import HireLine, calc_line_costs, catalog_codes, digits_only, find_item
+
 # ---------------- User-facing instructional text ----------------
 
 CUSTOMER_ENTRY_INSTRUCTIONS = (
@@ -32,31 +35,30 @@ MAIN_MENU_LINES = (
 
 PROMPT_SELECT_OPTION = "Select an option (1-3): "
 
-# ---------------- Catalogue & pricing ----------------
-
-CATALOG = (
-    {"code": "DCH", "name": "Day chairs", "daily_p": 1500},
-    {"code": "BCH", "name": "Bed chairs", "daily_p": 2500},
-    {"code": "BAS", "name": "Bite Alarm (set of 3)", "daily_p": 2000},
-    {"code": "BA1", "name": "Bite Alarm (single)", "daily_p": 500},
-    {"code": "BBT", "name": "Bait Boat", "daily_p": 6000},
-    {"code": "TNT", "name": "Camping tent", "daily_p": 2000},
-    {"code": "SLP", "name": "Sleeping bag", "daily_p": 2000},
-    {"code": "R3T", "name": "Rods (3lb TC)", "daily_p": 1000},
-    {"code": "RBR", "name": "Rods (Bait runners)", "daily_p": 500},
-    {"code": "REB", "name": "Reels (Bait runners)", "daily_p": 1000},
-    {"code": "STV", "name": "Camping Gas stove (Double burner)", "daily_p": 1000},
-)
+# ---------------- Hire records (fixed slots instead of per-record dicts) ----------------
+
+class HireRecord:
+    """One saved hire: customer, nights, return flag, lines and totals."""
+    __slots__ = ("customer_id", "customer_name", "nights", "returned_on_time",
+                 "lines", "extra_delay_p", "total_p", "items_summary")
 
-# 50% multiplier encoded as a rational for clarity
-ADDITIONAL_NIGHT_MULTIPLIER_NUM = 1
-ADDITIONAL_NIGHT_MULTIPLIER_DEN = 2
+    def __init__(self, customer_id: int, customer_name: str, nights: int,
+                 returned_on_time: bool, lines: list[HireLine], extra_delay_p: int,
+                 total_p: int, items_summary: str) -> None:
+        self.customer_id = customer_id
+        self.customer_name = customer_name
+        self.nights = nights
+        self.returned_on_time = returned_on_time
+        self.lines = lines
+        self.extra_delay_p = extra_delay_p
+        self.total_p = total_p
+        self.items_summary = items_summary
 
 
 class AppState:
     """Holds mutable programme state for the current run (Task 2 focuses on option 1)."""
     def __init__(self) -> None:
-        self.hire_records: list[dict] = []
+        self.hire_records: list[HireRecord] = []
         self.next_customer_id: int = 101
 
 
@@ -69,20 +71,6 @@ def money(pence: int) -> str:
     return f"£{pounds}.{pennies:02d}"
 
 
-def find_item(code: str) -> dict | None:
-    """Return the catalogue entry for code (case-insensitive) or None."""
-    code = str(code).upper()
-    for it in CATALOG:
-        if it["code"] == code:
-            return it
-    return None
-
-
-def catalog_codes() -> str:
-    """Return a comma-separated list of known item codes."""
-    return ", ".join(it["code"] for it in CATALOG)
-
-
 def print_main_menu() -> None:
     """Display the main menu (Task 2 emphasises option 1)."""
     for line in MAIN_MENU_LINES:
@@ -141,25 +129,25 @@ def _parse_customer_header(raw: str) -> dict:
     if not name:
         raise ValueError("Name cannot be empty.")
 
-    phone_digits = "".join(ch for ch in phone if ch.isdigit())
+    phone_digits = digits_only(phone)
     if len(phone_digits) < 7:
         raise ValueError("Phone should contain at least 7 digits.")
 
-    card_digits = "".join(ch for ch in card_last4 if ch.isdigit())
+    card_digits = digits_only(card_last4)
     if len(card_digits) != 4:
         raise ValueError("Card last 4 digits must be exactly 4 digits.")
 
     return {
-        "customer_name": name.strip(),
+        "customer_name": name,
         "phone": phone_digits,
-        "house_no": house_no.strip(),
-        "postcode": postcode.strip().upper(),
+        "house_no": house_no,
+        "postcode": postcode.upper(),
         "card_last4": card_digits,
     }
 
 
-def _parse_item_line(raw: str) -> tuple[str, int]:
-    """Return (code, qty) parsed from raw, or raise ValueError."""
+def _parse_item_line(raw: str) -> tuple[dict, int]:
+    """Return (catalogue item, qty) parsed from raw, or raise ValueError."""
     parts = [p.strip() for p in raw.split(",")]
     if len(parts) != 2:
         raise ValueError("Expected 2 fields: CODE, quantity")
@@ -178,7 +166,7 @@ def _parse_item_line(raw: str) -> tuple[str, int]:
     if qty < 1:
         raise ValueError("Quantity must be ≥ 1.")
 
-    return code, qty
+    return item, qty
 
 
 # ---------------- Interactive readers (loop + messages) ----------------
@@ -198,21 +186,12 @@ def read_customer_header() -> dict | None:
             print(err)
 
 
-def calc_line_costs(daily_p: int, qty: int, nights: int, returned_on_time: bool) -> tuple[int, int, int]:
-    """Return (first_night, additional, delay) in pence."""
-    first_night_p = daily_p * qty
-    add_per_night = (daily_p * qty * ADDITIONAL_NIGHT_MULTIPLIER_NUM) // ADDITIONAL_NIGHT_MULTIPLIER_DEN
-    additional_p = add_per_night * max(0, nights - 1)
-    extra_delay_p = 0 if returned_on_time else add_per_night
-    return first_night_p, additional_p, extra_delay_p
-
-
-def read_item_lines(nights: int, returned_on_time: bool) -> list[dict]:
+def read_item_lines(nights: int, returned_on_time: bool) -> list[HireLine]:
     """Collect item lines, computing totals eagerly for downstream reporting."""
     print(ITEM_LINES_INSTRUCTIONS)
     print(f"Nights for this hire: {nights}  | Returned on time: {returned_on_time}")
     print(f"Known codes: {catalog_codes()}")
-    lines: list[dict] = []
+    lines: list[HireLine] = []
 
     while True:
         raw = input("> ").strip()
@@ -223,24 +202,14 @@ def read_item_lines(nights: int, returned_on_time: bool) -> list[dict]:
             return lines
 
         try:
-            code, qty = _parse_item_line(raw)
+            item, qty = _parse_item_line(raw)
         except ValueError as err:
             print(err)
             continue
 
-        item = find_item(code)  # safe after _parse_item_line
         daily = item["daily_p"]
-        first_p, add_p, delay_p = calc_line_costs(daily, qty, nights, returned_on_time)
-        lines.append({
-            "code": code,
-            "name": item["name"],
-            "qty": qty,
-            "daily_p": daily,
-            "first_night_p": first_p,
-            "additional_nights_p": add_p,
-            "extra_delay_p": delay_p,
-            "line_total_p": first_p + add_p + delay_p,
-        })
+        first_p, add_p, delay_p = calc_line_costs(item, qty, nights, returned_on_time)
+        lines.append(HireLine(item["code"], item["name"], qty, daily, first_p, add_p, delay_p))
 
 
 # ---------------- Task 2 flow: option 1 only ----------------
@@ -256,31 +225,39 @@ def run_hire_flow(state: AppState) -> None:
     returned_on_time = read_yes_no("Returned on time (y/n)? ")
     lines = read_item_lines(nights, returned_on_time)
 
-    items_summary = ", ".join(f"{ln['name']} – {ln['qty']}" for ln in lines)
-    extra_delay_p = sum(ln["extra_delay_p"] for ln in lines)
-    total_p = sum(ln["line_total_p"] for ln in lines)
-
-    hire = {
-        "customer_id": state.next_customer_id,
-        "customer_name": header["customer_name"],
-        "nights": nights,
-        "returned_on_time": returned_on_time,  # bool internally
-        "lines": lines,
-        "extra_delay_p": extra_delay_p,
-        "total_p": total_p,
-        "items_summary": items_summary,
-    }
+    # One pass over the lines for the summary and both totals
+    parts: list[str] = []
+    extra_delay_p = 0
+    total_p = 0
+    for ln in lines:
+        parts.append(f"{ln.name} – {ln.qty}")
+        extra_delay_p += ln.extra_delay_p
+        total_p += ln.line_total_p
+    items_summary = ", ".join(parts)
+
+    hire = HireRecord(
+        state.next_customer_id,
+        header["customer_name"],
+        nights,
+        returned_on_time,  # bool internally
+        lines,
+        extra_delay_p,
+        total_p,
+        items_summary,
+    )
     state.hire_records.append(hire)
     state.next_customer_id += 1
 
-    print("\nSaved hire (Task 2):")
-    print(f"  Customer ID: {hire['customer_id']}")
-    print(f"  Customer:    {hire['customer_name']}")
-    print(f"  Equipment:   {items_summary}")
-    print(f"  Nights:      {nights}")
-    print(f"  Returned on time: {'y' if returned_on_time else 'n'}")
-    print(f"  Extra charge for delayed return: {money(extra_delay_p)}")
-    print(f"  Total cost:  {money(total_p)}\n")
+    print("\n".join([
+        "\nSaved hire (Task 2):",
+        f"  Customer ID: {hire.customer_id}",
+        f"  Customer:    {hire.customer_name}",
+        f"  Equipment:   {items_summary}",
+        f"  Nights:      {nights}",
+        f"  Returned on time: {'y' if returned_on_time else 'n'}",
+        f"  Extra charge for delayed return: {money(extra_delay_p)}",
+        f"  Total cost:  {money(total_p)}\n",
+    ]))
 
 
 # ---------------- Entry point (menu with Task 2 behaviour) ----------------
@@ -29,9 +29,15 @@ MAIN_MENU_LINES = (
     "2) Create report",
     "3) Exit",
 )
+# Joined once so each menu display is a single print
+_MAIN_MENU_TEXT = "\n".join(MAIN_MENU_LINES)
 
 PROMPT_SELECT_OPTION = "Select an option (1-3): "
 
+# Accepted answers for yes/no prompts
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
 # ---------- Catalogue (code → (name, daily_pence)) ----------
 
 CATALOG = {
@@ -48,7 +54,10 @@ CATALOG = {
     "STV": ("Camping Gas stove (Double burner)", 1000),
 }
 
-# Pricing multiplier for additional nights (50%)
+# Comma-separated code summary for prompts, built once (CATALOG is read-only)
+CATALOG_CODES_STR = ", ".join(CATALOG)
+
+# Pricing multiplier for additional nights (50%); calc_line_costs applies it as ">> 1"
 ADDITIONAL_NIGHT_MULTIPLIER_NUM = 1
 ADDITIONAL_NIGHT_MULTIPLIER_DEN = 2
 
@@ -61,23 +70,64 @@ TOTAL_WIDTH = 10
 ONTIME_WIDTH = 22
 EXTRA_WIDTH = 30
 
+# Row templates with the widths baked in once; Equipment arrives pre-padded
+_ROW_FMT = "{:<%d} | {} | {:<%d} | {:<%d} | {:<%d} | {:<%d}" % (
+    ID_WIDTH, NIGHTS_WIDTH, TOTAL_WIDTH, ONTIME_WIDTH, EXTRA_WIDTH)
+# Continuation rows: every column blank except Equipment
+_CONT_FMT = _ROW_FMT.format("", "{}", "", "", "", "")
+
+# ---------- Hire records ----------
+
+# bool → report flag, indexed by the bool itself (False → "n", True → "y")
+_YN = ("n", "y")
+
+class HireRecord:
+    """One saved hire; fixed slots keep report reads to attribute access.
+
+    The money columns and the y/n flag are formatted once here so repeated
+    report renders reuse them.
+    """
+    __slots__ = ("customer_id", "customer_name", "nights", "returned_on_time",
+                 "lines", "extra_delay_p", "total_p", "items_summary",
+                 "on_time_char", "extra_delay_s", "total_s")
+
+    def __init__(self, customer_id: int, customer_name: str, nights: int,
+                 returned_on_time: bool, lines: list[dict], extra_delay_p: int,
+                 total_p: int, items_summary: str) -> None:
+        self.customer_id = customer_id
+        self.customer_name = customer_name
+        self.nights = nights
+        self.returned_on_time = returned_on_time
+        self.on_time_char = _YN[returned_on_time]
+        self.lines = lines
+        self.extra_delay_p = extra_delay_p
+        self.total_p = total_p
+        self.items_summary = items_summary
+        self.extra_delay_s = money(extra_delay_p)
+        self.total_s = money(total_p)
+
 # ---------- State ----------
 
 class AppState:
     """Holds mutable programme state for the current run."""
     def __init__(self) -> None:
-        self.hire_records: list[dict] = []
+        self.hire_records: list[HireRecord] = []
 
 # ---------- Utilities ----------
 
+# pence → formatted string; report values repeat, so each is formatted once
+_MONEY_CACHE: dict[int, str] = {}
+
 def money(pence: int) -> str:
-    """Return integer pence as a sterling string '£x.xx'."""
-    pounds, pennies = pence // 100, pence % 100
-    return f"£{pounds}.{pennies:02d}"
+    """Return integer pence as a sterling string '£x.xx' (memoised per value)."""
+    text = _MONEY_CACHE.get(pence)
+    if text is None:
+        text = _MONEY_CACHE[pence] = "£%d.%02d" % divmod(pence, 100)
+    return text
 
-def catalog_codes() -> str:
-    """Return a comma-separated catalogue code summary for prompts."""
-    return ", ".join(CATALOG.keys())
+def _digits_only(text: str) -> str:
+    """Return only the digit characters of text."""
+    return "".join(filter(str.isdigit, text))
 
 def print_catalog_price_list() -> None:
     """Print available equipment and nightly prices (for Option 1 guidance)."""
@@ -87,8 +137,7 @@ def print_catalog_price_list() -> None:
 
 def print_main_menu() -> None:
     """Display the main menu exactly as specified in the brief."""
-    for line in MAIN_MENU_LINES:
-        print(line)
+    print(_MAIN_MENU_TEXT)
 
 def read_choice() -> int | None:
     """Return a validated menu choice (1–3) or None when invalid."""
@@ -103,9 +152,9 @@ def read_yes_no(prompt: str = "(y/n): ") -> bool:
     """Prompt until the user enters yes/no; return True for yes, False for no."""
     while True:
         s = input(prompt).strip().lower()
-        if s in ("y", "yes"):
+        if s in _YES:
             return True
-        if s in ("n", "no"):
+        if s in _NO:
             return False
         print("Please enter 'y' or 'n'.")
 
@@ -145,11 +194,11 @@ def _parse_customer_header(raw: str) -> dict:
     if not name:
         raise ValueError("Name cannot be empty.")
 
-    phone_digits = "".join(ch for ch in phone if ch.isdigit())
+    phone_digits = _digits_only(phone)
     if len(phone_digits) < 7:
         raise ValueError("Phone should contain at least 7 digits.")
 
-    card_digits = "".join(ch for ch in card_last4 if ch.isdigit())
+    card_digits = _digits_only(card_last4)
     if len(card_digits) != 4:
         raise ValueError("Card last 4 digits must be exactly 4 digits.")
 
@@ -162,22 +211,23 @@ def _parse_customer_header(raw: str) -> dict:
         "card_last4": card_digits,
     }
 
-def _parse_item_line(raw: str) -> tuple[str, int]:
-    """Return (code, qty) parsed from raw, or raise ValueError."""
+def _parse_item_line(raw: str) -> tuple[str, tuple[str, int], int]:
+    """Return (code, (name, daily_p), qty) parsed from raw, or raise ValueError."""
     parts = [p.strip() for p in raw.split(",")]
     if len(parts) != 2:
         raise ValueError("Expected 2 fields: CODE, quantity")
 
     code, qty_s = parts[0].upper(), parts[1]
-    if code not in CATALOG:
-        raise ValueError(f"Unknown code '{code}'. Known: {catalog_codes()}")
+    entry = CATALOG.get(code)
+    if entry is None:
+        raise ValueError(f"Unknown code '{code}'. Known: {CATALOG_CODES_STR}")
     try:
         qty = int(qty_s)
     except ValueError as exc:
         raise ValueError("Quantity must be a whole number.") from exc
     if qty < 1:
         raise ValueError("Quantity must be ≥ 1.")
-    return code, qty
+    return code, entry, qty
 
 # ---------- Interactive readers ----------
 
@@ -197,19 +247,34 @@ def read_customer_header() -> dict | None:
 
 def calc_line_costs(daily_p: int, qty: int, nights: int, on_time: bool) -> tuple[int, int, int]:
     """Return (first_night_p, additional_nights_p, extra_delay_p) in pence."""
-    first = daily_p * qty
-    # Using rational multiplier for clarity: (qty*daily) * 1/2 per extra night
-    add_each = (daily_p * qty * ADDITIONAL_NIGHT_MULTIPLIER_NUM) // ADDITIONAL_NIGHT_MULTIPLIER_DEN
-    additional = add_each * max(0, nights - 1)
-    extra = 0 if on_time else add_each
-    return first, additional, extra
-
-def read_item_lines(nights: int, on_time: bool) -> list[dict]:
-    """Collect item lines, computing totals eagerly for downstream reporting."""
+    base = daily_p * qty
+    # 1/2 multiplier specialised to a shift: base >> 1 == base // 2 for pence
+    half = base >> 1
+    extra_nights = nights - 1
+    additional_p = half * extra_nights if extra_nights > 0 else 0
+    extra_delay_p = 0 if on_time else half
+    return base, additional_p, extra_delay_p
+
+def read_item_lines(nights: int, on_time: bool) -> tuple[list[dict], str, int, int]:
+    """Collect item lines, computing totals eagerly for downstream reporting.
+
+    Returns (lines, items_summary, total_p, extra_delay_p), accumulated as
+    each line is accepted so callers need no further passes.
+    """
     print(ITEM_LINES_INSTRUCTIONS)
     print(f"Nights for this hire: {nights}  | Returned on time: {on_time}")
-    print(f"Known codes: {catalog_codes()}")
+    print(f"Known codes: {CATALOG_CODES_STR}")
     lines: list[dict] = []
+    summary_parts: list[str] = []
+    total_p = 0
+    extra_delay_p = 0
+    # nights and on_time are fixed for this hire, so price one unit of every
+    # code up front; each line is then a multiply by qty. Exact because every
+    # catalogue rate is whole pounds (even pence), so halving commutes with qty.
+    unit_costs = {
+        code: calc_line_costs(daily, 1, nights, on_time)
+        for code, (_, daily) in CATALOG.items()
+    }
 
     while True:
         raw = input("> ").strip()
@@ -217,16 +282,17 @@ def read_item_lines(nights: int, on_time: bool) -> list[dict]:
             if not lines:
                 print("You must enter at least one item.")
                 continue
-            return lines
+            return lines, ", ".join(summary_parts), total_p, extra_delay_p
 
         try:
-            code, qty = _parse_item_line(raw)
+            code, (name, daily), qty = _parse_item_line(raw)
         except ValueError as err:
             print(err)
             continue
 
-        name, daily = CATALOG[code]
-        first_p, add_p, delay_p = calc_line_costs(daily, qty, nights, on_time)
+        unit_first_p, unit_add_p, unit_delay_p = unit_costs[code]
+        first_p, add_p, delay_p = unit_first_p * qty, unit_add_p * qty, unit_delay_p * qty
+        line_total_p = first_p + add_p + delay_p
         lines.append({
             "code": code,
             "name": name,
@@ -235,39 +301,46 @@ def read_item_lines(nights: int, on_time: bool) -> list[dict]:
             "first_night_p": first_p,
             "additional_nights_p": add_p,
             "extra_delay_p": delay_p,
-            "line_total_p": first_p + add_p + delay_p,
+            "line_total_p": line_total_p,
         })
+        summary_parts.append(f"{name} – {qty}")
+        total_p += line_total_p
+        extra_delay_p += delay_p
 
 # ---------- Reporting helpers (word-wrapped Equipment column) ----------
 
 def _wrap_equipment(text: str, width: int) -> list[str]:
     """Word-wrap a comma-separated equipment string to a fixed width."""
     lines: list[str] = []
-    cur = ""
+    # Current row as a list of tokens plus its running length (no str re-concatenation)
+    cur_parts: list[str] = []
+    cur_len = 0
 
-    def flush() -> None:
-        nonlocal cur
-        if cur:
-            lines.append(cur.ljust(width))
-            cur = ""
-
-    for item in (p.strip() for p in text.split(",") if p.strip()):
+    for item in (p.strip() for p in text.split(",")):
+        if not item:
+            continue
         if len(item) > width:
-            flush()
+            if cur_parts:
+                lines.append("".join(cur_parts).ljust(width))
+                cur_parts = []
+                cur_len = 0
             for i in range(0, len(item), width):
                 chunk = item[i:i + width]
                 lines.append(chunk if len(chunk) == width else chunk.ljust(width))
             continue
 
-        token = (", " if cur else "") + item
-        if len(cur) + len(token) <= width:
-            cur += token
+        token = ", " + item if cur_parts else item
+        if cur_len + len(token) <= width:
+            cur_parts.append(token)
+            cur_len += len(token)
         else:
-            flush()
-            cur = item
+            # Only reachable with a non-empty row: a lone item always fits here
+            lines.append("".join(cur_parts).ljust(width))
+            cur_parts = [item]
+            cur_len = len(item)
 
-    if cur or not lines:
-        lines.append(cur.ljust(width))
+    if cur_parts or not lines:
+        lines.append("".join(cur_parts).ljust(width))
     return lines
 
 # ---------- Flows ----------
@@ -284,32 +357,28 @@ def run_hire_flow(state: AppState) -> None:
 
         nights = read_positive_int("Number of nights: ", min_value=1)
         on_time = read_yes_no("Returned on time (y/n)? ")
-        lines = read_item_lines(nights, on_time)
-
-        items_summary = ", ".join(f"{ln['name']} – {ln['qty']}" for ln in lines)
-        extra_delay_p = sum(ln["extra_delay_p"] for ln in lines)
-        total_p = sum(ln["line_total_p"] for ln in lines)
-
-        hire = {
-            "customer_id": header["customer_id"],      # manually entered now
-            "customer_name": header["customer_name"],
-            "nights": nights,
-            "returned_on_time": on_time,
-            "lines": lines,
-            "extra_delay_p": extra_delay_p,
-            "total_p": total_p,
-            "items_summary": items_summary,
-        }
+        lines, items_summary, total_p, extra_delay_p = read_item_lines(nights, on_time)
+
+        hire = HireRecord(
+            header["customer_id"],      # manually entered now
+            header["customer_name"],
+            nights,
+            on_time,
+            lines,
+            extra_delay_p,
+            total_p,
+            items_summary,
+        )
         state.hire_records.append(hire)
 
         print("\nSaved hire:")
-        print(f"  Customer ID: {hire['customer_id']}")
-        print(f"  Customer:    {hire['customer_name']}")
+        print(f"  Customer ID: {hire.customer_id}")
+        print(f"  Customer:    {hire.customer_name}")
         print(f"  Equipment:   {items_summary}")
         print(f"  Nights:      {nights}")
-        print(f"  Returned on time: {'y' if on_time else 'n'}")
-        print(f"  Extra charge for delayed return: {money(extra_delay_p)}")
-        print(f"  Total cost:  {money(total_p)}\n")
+        print(f"  Returned on time: {hire.on_time_char}")
+        print(f"  Extra charge for delayed return: {hire.extra_delay_s}")
+        print(f"  Total cost:  {hire.total_s}\n")
 
         if not read_yes_no("Add another hire (y/n)? "):
             print("Returning to main menu.")
@@ -346,34 +415,19 @@ def run_earnings_report(state: AppState) -> None:
         f"{'-'*ONTIME_WIDTH} + "
         f"{'-'*EXTRA_WIDTH}"
     )
-    print(header)
-    print(ruler)
-
+    out = [header, ruler]
     for h in state.hire_records:
-        total_money = money(h["total_p"])
-        extra_money = money(h["extra_delay_p"])
-        on_time_char = "y" if h["returned_on_time"] else "n"
-        lines = _wrap_equipment(h["items_summary"], EQUIPMENT_WIDTH)
+        lines = _wrap_equipment(h.items_summary, EQUIPMENT_WIDTH)
 
         # First row carries all fields
-        print(
-            f"{h['customer_id']:<{ID_WIDTH}} | "
-            f"{lines[0]} | "
-            f"{h['nights']:<{NIGHTS_WIDTH}} | "
-            f"{total_money:<{TOTAL_WIDTH}} | "
-            f"{on_time_char:<{ONTIME_WIDTH}} | "
-            f"{extra_money:<{EXTRA_WIDTH}}"
-        )
+        out.append(_ROW_FMT.format(h.customer_id, lines[0], h.nights,
+                                   h.total_s, h.on_time_char, h.extra_delay_s))
         # Continuation rows: only Equipment is populated
         for cont in lines[1:]:
-            print(
-                f"{'':<{ID_WIDTH}} | "
-                f"{cont} | "
-                f"{'':<{NIGHTS_WIDTH}} | "
-                f"{'':<{TOTAL_WIDTH}} | "
-                f"{'':<{ONTIME_WIDTH}} | "
-                f"{'':<{EXTRA_WIDTH}}"
-            )
+            out.append(_CONT_FMT.format(cont))
+
+    # Emit the whole table with one write instead of a print per row
+    print("\n".join(out))
 
 # ---------- Entry point ----------
 
@@ -12,6 +12,9 @@ Key rules:
 - Money is handled as integer pence to avoid floating-point error.
 """
 
+# Catalogue, line pricing and the hire-line record are shared between the hire scripts
+from catalog import HireLine, calc_line_costs, catalog_codes, digits_only, find_item
+
 # ==========================================
 # Aim to simplify and reduce complexity
 # AUDIENCE - shop staff
@@ -29,24 +32,45 @@ Key rules:
 
 
 # -----------------------------
-# Read-only equipment catalogue (Figure 2)
+# Earnings report layout (built once at import)
 # -----------------------------
-CATALOG = (
-    {"code": "DCH", "name": "Day chairs", "daily_p": 1500},   # £15.00
-    {"code": "BCH", "name": "Bed chairs", "daily_p": 2500},   # £25.00
-    {"code": "BAS", "name": "Bite Alarm (set of 3)", "daily_p": 2000},  # £20.00
-    {"code": "BA1", "name": "Bite Alarm (single)", "daily_p": 500},     # £5.00
-    {"code": "BBT", "name": "Bait Boat", "daily_p": 6000},    # £60.00
-    {"code": "TNT", "name": "Camping tent", "daily_p": 2000}, # £20.00
-    {"code": "SLP", "name": "Sleeping bag", "daily_p": 2000}, # £20.00
-    {"code": "R3T", "name": "Rods (3lb TC)", "daily_p": 1000},          # £10.00
-    {"code": "RBR", "name": "Rods (Bait runners)", "daily_p": 500},     # £5.00
-    {"code": "REB", "name": "Reels (Bait runners)", "daily_p": 1000},   # £10.00
-    {"code": "STV", "name": "Camping Gas stove (Double burner)", "daily_p": 1000},  # £10.00
+_REPORT_SEP = "-" * 118
+_REPORT_HEADER = (
+    f"{'ID':<4} | {'Customer Name':<20} | {'Equipment (Name – Qty)':<45} | "
+    f"{'Nights':>6} | {'On-Time':>7} | {'Late Fee':>10} | {'Total Cost':>12}"
 )
+_ROW_FMT = "{id:<4} | {name:<20} | {summary:<45} | {nights:>6} | {ot:>7} | {fee:>10} | {tot:>12}"
+
 
-ADDITIONAL_NIGHT_MULTIPLIER_NUM = 1  # for 50% we add daily_p // 2 per additional night
-ADDITIONAL_NIGHT_MULTIPLIER_DEN = 2
+# -----------------------------
+# Hire records (fixed slots, one object per hire; HireLine lives in catalog)
+# -----------------------------
+class HireRecord:
+    """One saved hire: customer, nights, return flag, lines and totals.
+
+    The money columns and the truncated equipment column are prepared once
+    here so report renders reuse them.
+    """
+    __slots__ = ("customer_id", "customer_name", "nights", "returned_on_time",
+                 "lines", "extra_delay_p", "total_p", "items_summary",
+                 "items_summary_short", "extra_delay_s", "total_s")
+
+    def __init__(self, customer_id: int, customer_name: str, nights: int,
+                 returned_on_time: bool, lines: list[HireLine], extra_delay_p: int,
+                 total_p: int, items_summary: str) -> None:
+        self.customer_id = customer_id
+        self.customer_name = customer_name
+        self.nights = nights
+        self.returned_on_time = returned_on_time
+        self.lines = lines
+        self.extra_delay_p = extra_delay_p
+        self.total_p = total_p
+        self.items_summary = items_summary
+        self.items_summary_short = (
+            items_summary if len(items_summary) <= 45 else items_summary[:42] + "..."
+        )
+        self.extra_delay_s = money(extra_delay_p)
+        self.total_s = money(total_p)
 
 
 # -----------------------------
@@ -55,7 +79,7 @@ ADDITIONAL_NIGHT_MULTIPLIER_DEN = 2
 class AppState:
     """Holds mutable program state for the current run."""
     def __init__(self) -> None:
-        self.hire_records = []      # list[dict]
+        self.hire_records = []      # list[HireRecord]
         self.next_customer_id = 101 # simple running ID (matches brief samples)
 
 
@@ -69,17 +93,6 @@ def money(pence: int) -> str:
     return f"£{pounds:,}.{pennies:02d}"
 
 
-def find_item(code: str) -> dict | None:
-    """Return catalog item dict by item code (case-insensitive), else None."""
-    code = code.upper()
-    return next((it for it in CATALOG if it["code"] == code), None)
-
-
-def catalog_codes() -> str:
-    """Return a compact string of known codes for prompts."""
-    return ", ".join(it["code"] for it in CATALOG)
-
-
 def print_main_menu() -> None:
     """Print the main menu (Task 1)."""
     print("\n=== Main Menu ===")
@@ -91,9 +104,10 @@ def print_main_menu() -> None:
 def read_choice() -> int | None:
     """Read a menu choice (1–3). Return int or None if invalid."""
     s = input("Select an option (1-3): ").strip()
-    if not s.isdigit():
+    try:
+        n = int(s)
+    except ValueError:
         return None
-    n = int(s)
     return n if n in (1, 2, 3) else None
 
 
@@ -111,6 +125,12 @@ def parse_csv_2_fields(line: str) -> tuple[str, str] | None:
     line = line.strip()
     if not line:
         return None
+    if '"' not in line:
+        # Fast path: without quotes a plain split gives the same fields
+        parts = line.split(",", 2)
+        if len(parts) != 2:
+            return None
+        return parts[0].strip(), parts[1].strip()
     # Simple hand-rolled parser for two fields with optional quotes
     in_quotes = False
     buf = []
@@ -142,10 +162,11 @@ def read_positive_int(prompt: str, min_value: int = 1) -> int:
     """Read a positive integer ≥ min_value."""
     while True:
         s = input(prompt).strip()
-        if not s.isdigit():
+        try:
+            n = int(s)
+        except ValueError:
             print("Please enter a whole number.")
             continue
-        n = int(s)
         if n < min_value:
             print(f"Please enter a number ≥ {min_value}.")
             continue
@@ -165,17 +186,14 @@ def read_customer_header() -> dict | None:
         print("Cancelled.")
         return None
 
-    fields = parse_csv_2_fields(s)
-    # If only two fields detected, retry with simple split by ',' to get 5
     parts = [p.strip() for p in s.split(",")]
     if len(parts) != 5:
         print("Expected 5 fields separated by commas.")
         return None
 
     name, phone, house_no, postcode, card_last4 = parts
-    name = name.strip()
-    phone_digits = "".join(ch for ch in phone if ch.isdigit())
-    card_digits = "".join(ch for ch in card_last4 if ch.isdigit())
+    phone_digits = digits_only(phone)
+    card_digits = digits_only(card_last4)
 
     if not name:
         print("Name cannot be empty.")
@@ -190,30 +208,19 @@ def read_customer_header() -> dict | None:
     return {
         "customer_name": name,
         "phone": phone_digits,
-        "house_no": house_no.strip(),
-        "postcode": postcode.strip().upper(),
+        "house_no": house_no,
+        "postcode": postcode.upper(),
         "card_last4": card_digits,
     }
 
 
-def calc_line_costs(daily_p: int, qty: int, nights: int,
-                    returned_on_time: bool) -> tuple[int, int, int]:
-    """Return (first_night_p, additional_p, extra_delay_p) for one line."""
-    first_night_p = daily_p * qty
-    add_per_night = (daily_p * qty * ADDITIONAL_NIGHT_MULTIPLIER_NUM) // \
-                    ADDITIONAL_NIGHT_MULTIPLIER_DEN
-    additional_p = add_per_night * max(0, nights - 1)
-    extra_delay_p = 0 if returned_on_time else add_per_night
-    return first_night_p, additional_p, extra_delay_p
-
-
-def read_item_lines(nights: int, returned_on_time: bool) -> list[dict]:
-    """Read item lines: 'CODE, quantity' (one per line). Returns computed line dicts."""
+def read_item_lines(nights: int, returned_on_time: bool) -> list[HireLine]:
+    """Read item lines: 'CODE, quantity' (one per line). Returns priced HireLine records."""
     print("\nEnter item lines (one per line), then press ENTER on a blank line to finish.")
     print("Format: CODE, quantity   e.g.,  DCH, 2")
     print(f"Nights for this hire: {nights}  | Returned on time: {returned_on_time}")
     print(f"Known codes: {catalog_codes()}")
-    lines: list[dict] = []
+    lines: list[HireLine] = []
 
     while True:
         raw = input("> ").strip()
@@ -244,17 +251,8 @@ def read_item_lines(nights: int, returned_on_time: bool) -> list[dict]:
             continue
 
         daily = item["daily_p"]
-        first_p, add_p, delay_p = calc_line_costs(daily, qty, nights, returned_on_time)
-        lines.append({
-            "code": code,
-            "name": item["name"],
-            "qty": qty,
-            "daily_p": daily,
-            "first_night_p": first_p,
-            "additional_nights_p": add_p,
-            "extra_delay_p": delay_p,
-            "line_total_p": first_p + add_p + delay_p,
-        })
+        first_p, add_p, delay_p = calc_line_costs(item, qty, nights, returned_on_time)
+        lines.append(HireLine(code, item["name"], qty, daily, first_p, add_p, delay_p))
 
 
 # -----------------------------
@@ -272,32 +270,39 @@ def run_hire_flow(state: AppState) -> None:
         returned_on_time = (read_yes_no("Returned on time (y/n)? ") == "y")
         lines = read_item_lines(nights, returned_on_time)
 
-        # Summarise line totals
-        items_summary = ", ".join(f"{ln['name']} – {ln['qty']}" for ln in lines)
-        extra_delay_p = sum(ln["extra_delay_p"] for ln in lines)
-        total_p = sum(ln["line_total_p"] for ln in lines)
-
-        hire = {
-            "customer_id": state.next_customer_id,
-            "customer_name": header["customer_name"],
-            "nights": nights,
-            "returned_on_time": "y" if returned_on_time else "n",
-            "lines": lines,
-            "extra_delay_p": extra_delay_p,
-            "total_p": total_p,
-            "items_summary": items_summary,
-        }
+        # Summarise line totals (summary text and both sums in one pass)
+        parts: list[str] = []
+        extra_delay_p = 0
+        total_p = 0
+        for ln in lines:
+            parts.append(f"{ln.name} – {ln.qty}")
+            extra_delay_p += ln.extra_delay_p
+            total_p += ln.line_total_p
+        items_summary = ", ".join(parts)
+
+        hire = HireRecord(
+            state.next_customer_id,
+            header["customer_name"],
+            nights,
+            returned_on_time,  # bool; shown as y/n only when printed
+            lines,
+            extra_delay_p,
+            total_p,
+            items_summary,
+        )
         state.hire_records.append(hire)
         state.next_customer_id += 1
 
-        print("\nSaved hire:")
-        print(f"  Customer ID: {hire['customer_id']}")
-        print(f"  Customer:    {hire['customer_name']}")
-        print(f"  Equipment:   {items_summary}")
-        print(f"  Nights:      {nights}")
-        print(f"  Returned on time: {hire['returned_on_time']}")
-        print(f"  Extra charge for delayed return: {money(extra_delay_p)}")
-        print(f"  Total cost:  {money(total_p)}\n")
+        print("\n".join([
+            "\nSaved hire:",
+            f"  Customer ID: {hire.customer_id}",
+            f"  Customer:    {hire.customer_name}",
+            f"  Equipment:   {items_summary}",
+            f"  Nights:      {nights}",
+            f"  Returned on time: {'y' if returned_on_time else 'n'}",
+            f"  Extra charge for delayed return: {hire.extra_delay_s}",
+            f"  Total cost:  {hire.total_s}\n",
+        ]))
 
         if read_yes_no("Add another hire (y/n)? ") == "n":
             print("Returning to main menu.")
@@ -313,37 +318,25 @@ def run_earnings_report(state: AppState) -> None:
         print("\nNo hires recorded yet.")
         return
 
-    print("\n" + "-" * 118)
-    print("Earnings Report")
-    print("-" * 118)
-
-    header = (
-        f"{'ID':<4} | {'Customer Name':<20} | {'Equipment (Name – Qty)':<45} | "
-        f"{'Nights':>6} | {'On-Time':>7} | {'Late Fee':>10} | {'Total Cost':>12}"
-    )
-    print(header)
-    print("-" * 118)
+    # Collect the whole report and print it once rather than per row
+    out = ["\n" + _REPORT_SEP, "Earnings Report", _REPORT_SEP, _REPORT_HEADER, _REPORT_SEP]
 
     grand_total = 0
     for record in state.hire_records:
-        items_summary = record["items_summary"]
-        if len(items_summary) > 45:
-            items_summary = items_summary[:42] + "..."
-
-        row = (
-            f"{record['customer_id']:<4} | "
-            f"{record['customer_name']:<20} | "
-            f"{items_summary:<45} | "
-            f"{record['nights']:>6} | "
-            f"{record['returned_on_time']:>7} | "
-            f"{money(record['extra_delay_p']):>10} | "
-            f"{money(record['total_p']):>12}"
-        )
-        print(row)
-        grand_total += record["total_p"]
-
-    print("-" * 118)
-    print(f"{'TOTAL EARNINGS':>100} : {money(grand_total):>15}")
+        out.append(_ROW_FMT.format(
+            id=record.customer_id,
+            name=record.customer_name,
+            summary=record.items_summary_short,
+            nights=record.nights,
+            ot="y" if record.returned_on_time else "n",
+            fee=record.extra_delay_s,
+            tot=record.total_s,
+        ))
+        grand_total += record.total_p
+
+    out.append(_REPORT_SEP)
+    out.append(f"{'TOTAL EARNINGS':>100} : {money(grand_total):>15}")
+    print("\n".join(out))
 
 
 # -----------------------------